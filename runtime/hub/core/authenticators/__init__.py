@@ -31,6 +31,14 @@
 
 LOCAL_ACCOUNT_PREFIX = "LocalAccount"
 
+# auth_mode -> authenticator class ("dummy" is JupyterHub's built-in entry point name)
+_AUTHENTICATOR_CLASSES = {
+    "auto-login": AutoLoginAuthenticator,
+    "dummy": "dummy",
+    "github": CustomGitHubOAuthenticator,
+    "multi": CustomMultiAuthenticator,
+}
+
 
 def create_authenticator(auth_mode: str, **kwargs):
     """
@@ -43,17 +51,11 @@ def create_authenticator(auth_mode: str, **kwargs):
     Returns:
         Authenticator class (not instance)
     """
-    if auth_mode == "auto-login":
-        return AutoLoginAuthenticator
-    elif auth_mode == "dummy":
-        return "dummy"
-    elif auth_mode == "github":
-        return CustomGitHubOAuthenticator
-    elif auth_mode == "multi":
-        return CustomMultiAuthenticator
-    else:
+    authenticator_class = _AUTHENTICATOR_CLASSES.get(auth_mode)
+    if authenticator_class is None:
         print(f"[WARN] Unknown auth mode: {auth_mode}, falling back to dummy")
         return "dummy"
+    return authenticator_class
 
 
 __all__ = [
@@ -26,8 +26,12 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import bcrypt
 from firstuseauthenticator import FirstUseAuthenticator
+from jupyterhub.orm import User
+from traitlets import Integer
 
 from core.authenticators.models import UserPassword
 from core.database import get_session, session_scope
@@ -47,6 +51,16 @@ class CustomFirstUseAuthenticator(FirstUseAuthenticator):
     login_service = "Native"
     create_users = False
 
+    bcrypt_rounds = Integer(
+        12,
+        config=True,
+        help="bcrypt cost factor (log2 rounds) used when hashing new passwords.",
+    )
+
+    # Usernames flagged for forced password change, loaded from the database
+    # on first use and kept in sync by set_password/mark_force_password_change
+    _force_change_users: set[str] | None = None
+
     def normalize_username(self, username):
         """Normalize username to lowercase."""
         if not username:
@@ -65,8 +79,6 @@ def _user_exists(self, username):
         else:
             db = self.db
 
-        from jupyterhub.orm import User
-
         return db.query(User).filter_by(name=username).first() is not None
 
     def _get_user_password(self, username: str) -> UserPassword | None:
@@ -81,14 +93,12 @@ def _validate_password(self, password):
         """Validate password meets minimum requirements."""
         return password and len(password) >= getattr(self, "min_password_length", 1)
 
-    def set_password(self, username: str, password: str, force_change: bool = True) -> str:
-        """Set password for a user."""
-        if not self._validate_password(password):
-            min_len = getattr(self, "min_password_length", 1)
-            return f"Password too short! Minimum {min_len} characters required."
-
-        password_hash = bcrypt.hashpw(password.encode("utf8"), bcrypt.gensalt())
+    def _hash_password(self, password: str) -> bytes:
+        """Hash a password with bcrypt at the configured cost."""
+        return bcrypt.hashpw(password.encode("utf8"), bcrypt.gensalt(self.bcrypt_rounds))
 
+    def _store_password(self, username: str, password_hash: bytes, force_change: bool) -> str:
+        """Create or update the stored password hash for a user."""
         with session_scope() as session:
             user_pw = session.query(UserPassword).filter_by(username=username).first()
             if user_pw:
@@ -101,21 +111,60 @@ def set_password(self, username: str, password: str, force_change: bool = True)
                     force_change=force_change,
                 )
                 session.add(user_pw)
+        self._update_force_change_cache(username, force_change)
 
         suffix = " (force change on next login)" if force_change else ""
         return f"Password set for {username}{suffix}"
 
+    def set_password(self, username: str, password: str, force_change: bool = True) -> str:
+        """Set password for a user."""
+        if not self._validate_password(password):
+            min_len = getattr(self, "min_password_length", 1)
+            return f"Password too short! Minimum {min_len} characters required."
+
+        return self._store_password(username, self._hash_password(password), force_change)
+
+    async def aset_password(self, username: str, password: str, force_change: bool = True) -> str:
+        """Set password for a user, hashing in a worker thread to keep the event loop free."""
+        if not self._validate_password(password):
+            min_len = getattr(self, "min_password_length", 1)
+            return f"Password too short! Minimum {min_len} characters required."
+
+        password_hash = await asyncio.to_thread(self._hash_password, password)
+        return self._store_password(username, password_hash, force_change)
+
     def mark_force_password_change(self, username: str, force: bool = True) -> None:
         """Mark or unmark a user for forced password change."""
         with session_scope() as session:
             user_pw = session.query(UserPassword).filter_by(username=username).first()
-            if user_pw:
-                user_pw.force_change = force
+            if not user_pw:
+                return
+            user_pw.force_change = force
+        self._update_force_change_cache(username, force)
+
+    def _get_force_change_users(self) -> set[str]:
+        """Return the set of usernames flagged for forced password change."""
+        if self._force_change_users is None:
+            session = get_session()
+            try:
+                rows = session.query(UserPassword.username).filter_by(force_change=True).all()
+            finally:
+                session.close()
+            self._force_change_users = {username for (username,) in rows}
+        return self._force_change_users
+
+    def _update_force_change_cache(self, username: str, force: bool) -> None:
+        """Mirror a committed force_change update into the in-memory set."""
+        if self._force_change_users is None:
+            return
+        if force:
+            self._force_change_users.add(username)
+        else:
+            self._force_change_users.discard(username)
 
     def needs_password_change(self, username: str) -> bool:
         """Check if user needs to change their password."""
-        user_pw = self._get_user_password(username)
-        return user_pw.force_change if user_pw else False
+        return username in self._get_force_change_users()
 
     def clear_force_password_change(self, username: str) -> None:
         """Clear the forced password change flag for a user."""
@@ -149,10 +198,11 @@ async def authenticate(self, _handler, data):
             self.log.warning(f"User {username} not found in JupyterHub database")
             return None
 
-        # Check if user has a password set
-        if self.user_has_password(username):
+        # Check if user has a password set (one lookup serves the check and the verify)
+        user_pw = self._get_user_password(username)
+        if user_pw is not None:
             # Verify existing password
-            if self.check_password(username, password):
+            if await asyncio.to_thread(bcrypt.checkpw, password.encode("utf8"), user_pw.password_hash):
                 return username
             self.log.warning(f"Invalid password for user {username}")
             return None
@@ -161,6 +211,6 @@ async def authenticate(self, _handler, data):
             if not self._validate_password(password):
                 self.log.warning(f"Password too short for new user {username}")
                 return None
-            self.set_password(username, password, force_change=False)
+            await self.aset_password(username, password, force_change=False)
             self.log.info(f"Password set for new user {username}")
             return username
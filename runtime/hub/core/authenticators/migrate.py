@@ -34,18 +34,41 @@
 
 import dbm
 import os
-from pathlib import Path
+from typing import TYPE_CHECKING
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, insert, select
 
 from core.authenticators.models import UserPassword
 from core.database import Base
+from core.fsutil import create_marker_file, fsync_directory
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
 
 OLD_PASSWORDS_DBM = "/srv/jupyterhub/passwords.dbm"
 OLD_FORCE_CHANGE_DBM = "/srv/jupyterhub/force_password_change.dbm"
 MIGRATION_MARKER = "/srv/jupyterhub/.auth_migrated"
 
+# DBM backends store a database as the base path plus one of these extensions
+DBM_EXTENSIONS = ("", ".db", ".dir", ".pag", ".dat")
+
+
+def _find_dbm_files(*base_paths: str) -> list[str]:
+    """Return the files making up the given DBM databases, listing each directory once."""
+    candidates: dict[str, set[str]] = {}
+    for base_path in base_paths:
+        directory, base_name = os.path.split(base_path)
+        candidates.setdefault(directory, set()).update(base_name + ext for ext in DBM_EXTENSIONS)
+
+    found = []
+    for directory, names in candidates.items():
+        try:
+            entries = os.listdir(directory)
+        except FileNotFoundError:
+            continue
+        found.extend(os.path.join(directory, name) for name in entries if name in names)
+    return found
+
 
 def check_migration_needed() -> bool:
     """Check if migration is needed."""
@@ -55,17 +78,32 @@ def check_migration_needed() -> bool:
 
     # Skip if old database doesn't exist
     # DBM files may have extensions like .db, .dir, .pag
-    dbm_exists = any(os.path.exists(f"{OLD_PASSWORDS_DBM}{ext}") for ext in ["", ".db", ".dir", ".pag", ".dat"])
+    return bool(_find_dbm_files(OLD_PASSWORDS_DBM))
+
+
+def _iter_dbm_keys(db):
+    """
+    Yield the keys of an open DBM database.
 
-    return dbm_exists
+    gdbm handles are walked with the firstkey()/nextkey() cursor so the key
+    list is never materialized; other backends fall back to keys().
+    """
+    if hasattr(db, "firstkey"):
+        key = db.firstkey()
+        while key is not None:
+            yield key
+            key = db.nextkey(key)
+    else:
+        yield from db.keys()
 
 
-def migrate_auth_data(target_db_url: str) -> dict:
+def migrate_auth_data(target_db_url: str, batch_size: int = 1000) -> dict:
     """
     Migrate auth data from old DBM files to new database.
 
     Args:
         target_db_url: SQLAlchemy URL for the target database
+        batch_size: Number of users inserted and committed per transaction
 
     Returns:
         Migration statistics
@@ -84,57 +122,63 @@ def migrate_auth_data(target_db_url: str) -> dict:
         # Connect to new database
         engine = create_engine(target_db_url)
         Base.metadata.create_all(engine)
-        SessionFactory = sessionmaker(bind=engine)
-        session = SessionFactory()
 
         # Load force change flags first
-        force_change_users = set()
+        force_change_users: frozenset[str] = frozenset()
         try:
             with dbm.open(OLD_FORCE_CHANGE_DBM, "r") as db:
-                for key in db:
-                    username = key.decode("utf8") if isinstance(key, bytes) else key
-                    force_change_users.add(username)
+                force_change_users = frozenset(
+                    key.decode("utf8") if isinstance(key, bytes) else key for key in _iter_dbm_keys(db)
+                )
         except Exception as e:
             print(f"[AUTH MIGRATION] No force_change data or error: {e}")
 
         # Migrate passwords
         print("[AUTH MIGRATION] Migrating user passwords...")
         try:
+            # Users already present in the new table (resumed migration) are skipped
+            with engine.connect() as conn:
+                existing_users = set(conn.execute(select(UserPassword.username)).scalars())
+            rows = []
             with dbm.open(OLD_PASSWORDS_DBM, "r") as db:
-                for key in db:
+                for key in _iter_dbm_keys(db):
                     try:
                         username = key.decode("utf8") if isinstance(key, bytes) else key
-                        password_hash = db[key]
-
-                        # Check if user already exists in new table
-                        existing = session.query(UserPassword).filter_by(username=username).first()
-
-                        if existing:
+                        if username in existing_users:
                             print(f"[AUTH MIGRATION] User {username} already exists, skipping")
-                        else:
-                            user_pw = UserPassword(
-                                username=username,
-                                password_hash=password_hash,
-                                force_change=username in force_change_users,
-                            )
-                            session.add(user_pw)
-                            stats["users_migrated"] += 1
+                            continue
+                        rows.append(
+                            {
+                                "username": username,
+                                "password_hash": db[key],
+                                "force_change": username in force_change_users,
+                            }
+                        )
 
                     except Exception as e:
                         stats["errors"].append(f"User {key}: {e}")
 
+                    # Commit in batches so huge DBM files don't build one giant transaction
+                    if len(rows) >= batch_size:
+                        _insert_password_rows(engine, rows)
+                        stats["users_migrated"] += len(rows)
+                        rows = []
+
+            if rows:
+                _insert_password_rows(engine, rows)
+                stats["users_migrated"] += len(rows)
+
         except Exception as e:
-            stats["errors"].append(f"Failed to open passwords DBM: {e}")
+            stats["errors"].append(f"Failed to migrate passwords DBM: {e}")
             stats["status"] = "error"
             return stats
 
-        session.commit()
-        session.close()
+        engine.dispose()
 
         print(f"[AUTH MIGRATION] Migrated {stats['users_migrated']} users")
 
         # Mark migration as complete
-        _mark_migration_complete()
+        create_marker_file(MIGRATION_MARKER)
 
         # Rename old files to backup
         _backup_old_files()
@@ -150,23 +194,22 @@ def migrate_auth_data(target_db_url: str) -> dict:
     return stats
 
 
-def _mark_migration_complete():
-    """Create a marker file to indicate migration is complete."""
-    Path(MIGRATION_MARKER).touch()
+def _insert_password_rows(engine: Engine, rows: list[dict]) -> None:
+    """Insert a batch of password rows in its own transaction, bypassing the ORM unit of work."""
+    with engine.begin() as conn:
+        conn.execute(insert(UserPassword.__table__), rows)
 
 
 def _backup_old_files():
     """Rename old DBM files to backup."""
-    for base_path in [OLD_PASSWORDS_DBM, OLD_FORCE_CHANGE_DBM]:
-        for ext in ["", ".db", ".dir", ".pag", ".dat"]:
-            old_path = f"{base_path}{ext}"
-            if os.path.exists(old_path):
-                backup_path = f"{old_path}.migrated"
-                try:
-                    os.rename(old_path, backup_path)
-                    print(f"[AUTH MIGRATION] Backed up {old_path} to {backup_path}")
-                except Exception as e:
-                    print(f"[AUTH MIGRATION] Failed to backup {old_path}: {e}")
+    for old_path in _find_dbm_files(OLD_PASSWORDS_DBM, OLD_FORCE_CHANGE_DBM):
+        backup_path = f"{old_path}.migrated"
+        try:
+            os.replace(old_path, backup_path)
+            print(f"[AUTH MIGRATION] Backed up {old_path} to {backup_path}")
+        except Exception as e:
+            print(f"[AUTH MIGRATION] Failed to backup {old_path}: {e}")
+    fsync_directory(os.path.dirname(OLD_PASSWORDS_DBM))
 
 
 if __name__ == "__main__":
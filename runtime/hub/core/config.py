@@ -39,12 +39,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 import yaml
 from pydantic import BaseModel, Field
 
+# Use the libyaml C parser when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # =============================================================================
 # YAML Configuration Models
 # =============================================================================
@@ -208,6 +212,9 @@ def __init__(self):
         # JupyterHub config object (set during setup)
         self._jupyterhub_config: Any = None
 
+        # Memoized build_* results; cleared whenever the config is (re)loaded
+        self._derived: dict[str, Any] = {}
+
     @classmethod
     def init(cls, config_path: str | Path) -> HubConfig:
         """
@@ -225,12 +232,12 @@ def init(cls, config_path: str | Path) -> HubConfig:
         instance = cls._instance
         config_path = Path(config_path)
 
-        # Load configuration from YAML file
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-        with open(config_path, encoding="utf-8") as f:
-            raw_config = yaml.safe_load(f) or {}
+        # Load configuration from YAML file (one read; libyaml parses the bytes directly)
+        try:
+            raw_yaml = config_path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+        raw_config = yaml.load(raw_yaml, Loader=_YamlLoader) or {}
 
         print(f"[CONFIG] Loaded configuration from {config_path}")
 
@@ -253,6 +260,7 @@ def init(cls, config_path: str | Path) -> HubConfig:
             quota=raw_config.get("quota"),
             git_clone=raw_config.get("gitClone"),
         )
+        instance._derived.clear()
 
         # Quota enabled: from config or auto-detect based on auth_mode
         if instance._config.quota.enabled is not None:
@@ -352,44 +360,63 @@ def get_accelerator_env(self, accelerator_key: str) -> dict[str, str]:
 
     def get_quota_rate(self, accelerator_key: str | None) -> int:
         """Get quota rate for an accelerator type."""
-        if not accelerator_key:
-            return self._config.quota.cpuRate
-        if accelerator_key in self._config.accelerators:
-            return self._config.accelerators[accelerator_key].quotaRate
-        return self._config.quota.cpuRate
+        rates = self.build_quota_rates()
+        return rates.get(accelerator_key or "cpu", rates["cpu"])
 
     def get_team_resources(self, team: str) -> list[str]:
         """Get available resources for a team."""
         return self._config.teams.mapping.get(team, [])
 
+    def _build_once(self, name: str, build: Callable[[], Any]) -> Any:
+        """Return the memoized result of a build_* helper, computing it on first use."""
+        if name not in self._derived:
+            self._derived[name] = build()
+        return self._derived[name]
+
     def build_quota_rates(self) -> dict[str, int]:
         """Build quota rates dict from accelerators config."""
-        rates = {"cpu": self._config.quota.cpuRate}
-        for key, accel in self._config.accelerators.items():
-            rates[key] = accel.quotaRate
-        return rates
+
+        def build() -> dict[str, int]:
+            rates = {"cpu": self._config.quota.cpuRate}
+            for key, accel in self._config.accelerators.items():
+                rates[key] = accel.quotaRate
+            return rates
+
+        return self._build_once("quota_rates", build)
 
     def build_resource_images(self) -> dict[str, str]:
         """Build resource images dict."""
-        return dict(self._config.resources.images)
+        return self._build_once("resource_images", lambda: dict(self._config.resources.images))
 
     def build_resource_requirements(self) -> dict[str, dict]:
         """Build resource requirements dict."""
-        return {
-            k: v.model_dump(by_alias=True, exclude_none=True) for k, v in self._config.resources.requirements.items()
-        }
+        return self._build_once(
+            "resource_requirements",
+            lambda: {
+                k: v.model_dump(by_alias=True, exclude_none=True)
+                for k, v in self._config.resources.requirements.items()
+            },
+        )
+
+    def build_accelerator_options(self) -> dict[str, dict]:
+        """Build serialized accelerator options dict."""
+        return self._build_once(
+            "accelerator_options", lambda: {k: v.model_dump() for k, v in self._config.accelerators.items()}
+        )
 
     def build_node_selector_mapping(self) -> dict[str, dict[str, str]]:
         """Build node selector mapping from accelerators."""
-        return {k: v.nodeSelector for k, v in self._config.accelerators.items()}
+        return self._build_once(
+            "node_selector_mapping", lambda: {k: v.nodeSelector for k, v in self._config.accelerators.items()}
+        )
 
     def build_environment_mapping(self) -> dict[str, dict[str, str]]:
         """Build environment mapping from accelerators."""
-        return {k: v.env for k, v in self._config.accelerators.items()}
+        return self._build_once("environment_mapping", lambda: {k: v.env for k, v in self._config.accelerators.items()})
 
     def build_team_resource_mapping(self) -> dict[str, list[str]]:
         """Build team resource mapping."""
-        return dict(self._config.teams.mapping)
+        return self._build_once("team_resource_mapping", lambda: dict(self._config.teams.mapping))
 
 
 # =============================================================================
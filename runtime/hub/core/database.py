@@ -28,9 +28,9 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import BigInteger, create_engine, event, inspect, text
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 if TYPE_CHECKING:
@@ -60,13 +60,38 @@ def init_database(db_url: str) -> Engine:
     if _engine is not None:
         return _engine
 
-    _engine = create_engine(db_url, pool_pre_ping=True)
+    engine_kwargs: dict[str, Any] = {"pool_pre_ping": True}
+    if not db_url.startswith("sqlite"):
+        # Server databases: allow concurrent spawns/logins to hold connections
+        # without queueing, and recycle before server-side idle timeouts
+        engine_kwargs.update(pool_size=20, max_overflow=40, pool_recycle=1800)
+
+    _engine = create_engine(db_url, **engine_kwargs)
+    if db_url.startswith("sqlite"):
+        event.listen(_engine, "connect", _set_sqlite_pragmas)
     _SessionFactory = sessionmaker(bind=_engine)
 
     print(f"[DATABASE] Initialized: {db_url}")
     return _engine
 
 
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """
+    Tune each new SQLite connection.
+
+    WAL lets readers proceed while a write is in progress and, with
+    synchronous=NORMAL, avoids an fsync on every commit.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+    finally:
+        cursor.close()
+
+
 def get_engine() -> Engine:
     """Get the shared database engine."""
     if _engine is None:
@@ -117,3 +142,63 @@ def create_all_tables():
     _ = _quota_orm.UserQuota
 
     Base.metadata.create_all(_engine)
+
+    # create_all() skips existing tables, so add indexes introduced after a table was created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(_engine, checkfirst=True)
+
+    _drop_superseded_indexes(_engine)
+    _widen_bigint_columns(_engine)
+
+
+# Indexes created by earlier schema versions and since replaced, per table
+SUPERSEDED_INDEXES: dict[str, tuple[str, ...]] = {
+    # Covered by the leading column of idx_quota_tx_username_created
+    "quota_transactions": ("ix_quota_transactions_username",),
+    # Replaced by the partial idx_usage_sessions_active
+    "quota_usage_sessions": ("ix_quota_usage_sessions_status", "idx_usage_sessions_username_status"),
+}
+
+
+def _drop_superseded_indexes(engine: Engine) -> None:
+    """Drop indexes left behind on existing databases by earlier schema versions."""
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table_name, index_names in SUPERSEDED_INDEXES.items():
+            if not inspector.has_table(table_name):
+                continue
+            existing = {index["name"] for index in inspector.get_indexes(table_name)}
+            for index_name in index_names:
+                if index_name not in existing:
+                    continue
+                print(f"[DATABASE] Dropping superseded index {index_name} on {table_name}")
+                if engine.dialect.name == "mysql":
+                    conn.execute(text(f"DROP INDEX `{index_name}` ON `{table_name}`"))
+                else:
+                    conn.execute(text(f'DROP INDEX IF EXISTS "{index_name}"'))
+
+
+def _widen_bigint_columns(engine: Engine) -> None:
+    """Upgrade existing INTEGER columns that the models now declare as BIGINT."""
+    # SQLite integers are already 64-bit regardless of the declared type
+    if engine.dialect.name not in ("postgresql", "mysql"):
+        return
+
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {col["name"]: col["type"] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if not isinstance(column.type, BigInteger) or column.name not in existing:
+                    continue
+                if isinstance(existing[column.name], BigInteger):
+                    continue
+                print(f"[DATABASE] Widening {table.name}.{column.name} to BIGINT")
+                if engine.dialect.name == "postgresql":
+                    conn.execute(text(f'ALTER TABLE "{table.name}" ALTER COLUMN "{column.name}" TYPE BIGINT'))
+                else:
+                    null = "NULL" if column.nullable else "NOT NULL"
+                    conn.execute(text(f"ALTER TABLE `{table.name}` MODIFY `{column.name}` BIGINT {null}"))
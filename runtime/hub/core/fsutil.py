@@ -0,0 +1,56 @@
+# Modifications Copyright (C) 2025 Advanced Micro Devices, Inc. All rights reserved.
+# Portions of this file consist of AI-generated content.
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Filesystem Helpers
+
+Durable file operations shared by the one-shot data migrations.
+"""
+
+from __future__ import annotations
+
+import os
+
+
+def fsync_directory(directory: str) -> bool:
+    """
+    Flush directory entries (created or renamed files) to disk.
+
+    Best-effort: some volumes (NFS, overlay mounts) reject fsync on a directory.
+    The failure is logged and False returned instead of aborting the caller
+    after its files have already been created or renamed.
+    """
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    except OSError as e:
+        print(f"[FSUTIL] Warning: could not fsync directory {directory}: {e}")
+        return False
+    return True
+
+
+def create_marker_file(path: str) -> None:
+    """Create an empty marker file and make its directory entry durable."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    os.close(fd)
+    fsync_directory(os.path.dirname(path))
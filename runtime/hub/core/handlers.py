@@ -172,7 +172,7 @@ async def post(self):
             return self.finish("Current password is incorrect")
 
         try:
-            result = firstuse_auth.set_password(username, new_password, force_change=False)
+            result = await firstuse_auth.aset_password(username, new_password, force_change=False)
             if "too short" in result.lower():
                 self.set_status(400)
                 return self.finish(result)
@@ -333,7 +333,7 @@ async def post(self):
                 self.set_header("Content-Type", "application/json")
                 return self.finish(json.dumps({"error": "Password management not available"}))
 
-            result = firstuse_auth.set_password(username, password, force_change=force_change)
+            result = await firstuse_auth.aset_password(username, password, force_change=force_change)
 
             if "too short" in result.lower():
                 self.set_status(400)
@@ -888,7 +888,7 @@ async def _try_dulwich(self, url: str, branch: str, token: str = "") -> dict | N
             from dulwich.porcelain import ls_remote
 
             ls_result = await asyncio.wait_for(
-                asyncio.get_event_loop().run_in_executor(None, ls_remote, check_url),
+                asyncio.get_running_loop().run_in_executor(None, ls_remote, check_url),
                 timeout=10,
             )
             refs = ls_result.refs
@@ -28,8 +28,11 @@
 
 import re
 import threading
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 
+from sqlalchemy import insert
+
 from core.database import get_session, session_scope
 from core.quota.orm import QuotaTransaction, UsageSession, UserQuota
 
@@ -87,7 +90,7 @@ def can_start_container(
         username: str,
         accelerator_type: str,
         runtime_minutes: int,
-        quota_rates: dict[str, int],
+        quota_rates: Mapping[str, int],
         default_quota: int = 0,
     ) -> tuple[bool, str, int]:
         """
@@ -312,7 +315,7 @@ def end_session(self, session_id: int, quota_consumed: int = 0) -> dict | None:
                 "quota_consumed": quota_consumed,
             }
 
-    def end_usage_session(self, session_id: int, quota_rates: dict[str, int]) -> tuple[int, int]:
+    def end_usage_session(self, session_id: int, quota_rates: Mapping[str, int]) -> tuple[int, int]:
         """
         End a usage session and calculate quota consumed.
 
@@ -542,6 +545,7 @@ def batch_refresh_quota(
             users_updated = 0
             total_change = 0
             skipped = 0
+            transaction_rows = []
 
             for user in users:
                 username = user.username
@@ -571,19 +575,24 @@ def batch_refresh_quota(
                 change = new_balance - current
                 user.balance = new_balance
 
-                transaction = QuotaTransaction(
-                    username=username,
-                    amount=change,
-                    transaction_type="auto_refresh",
-                    balance_before=current,
-                    balance_after=new_balance,
-                    description=f"Auto {action}: {rule_name}",
+                transaction_rows.append(
+                    {
+                        "username": username,
+                        "amount": change,
+                        "transaction_type": "auto_refresh",
+                        "balance_before": current,
+                        "balance_after": new_balance,
+                        "description": f"Auto {action}: {rule_name}",
+                    }
                 )
-                session.add(transaction)
 
                 users_updated += 1
                 total_change += change
 
+            # One multi-row insert for the audit log, in the same transaction as the balance updates
+            if transaction_rows:
+                session.execute(insert(QuotaTransaction), transaction_rows)
+
             print(
                 f"[QUOTA] Refresh '{rule_name}' ({action}): {users_updated} users updated, {skipped} skipped, change={total_change:+d}"
             )
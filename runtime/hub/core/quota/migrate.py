@@ -39,12 +39,12 @@
 import os
 import sqlite3
 from datetime import datetime
-from pathlib import Path
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from core.database import Base
+from core.fsutil import create_marker_file, fsync_directory
 from core.quota.orm import QuotaTransaction, UsageSession, UserQuota
 
 OLD_DB_PATH = "/srv/jupyterhub/quota.sqlite"
@@ -107,10 +107,11 @@ def migrate_quota_data(target_db_url: str) -> dict:
         # Migrate user_quota -> quota_user_quota
         print("[QUOTA MIGRATION] Migrating user quotas...")
         old_cursor.execute("SELECT * FROM user_quota")
+        # Load users already in the new table once instead of querying per row
+        existing_users = {quota.username: quota for quota in session.query(UserQuota)}
         for row in old_cursor.fetchall():
             try:
-                # Check if user already exists in new table
-                existing = session.query(UserQuota).filter(UserQuota.username == row["username"]).first()
+                existing = existing_users.get(row["username"])
 
                 if existing:
                     # Update existing record if old has higher balance
@@ -127,6 +128,7 @@ def migrate_quota_data(target_db_url: str) -> dict:
                         updated_at=_parse_datetime(_row_get(row, "updated_at")),
                     )
                     session.add(user)
+                    existing_users[user.username] = user
 
                 stats["users_migrated"] += 1
             except Exception as e:
@@ -187,11 +189,12 @@ def migrate_quota_data(target_db_url: str) -> dict:
         old_conn.close()
 
         # Mark migration as complete
-        _mark_migration_complete()
+        create_marker_file(MIGRATION_MARKER)
 
         # Rename old database to backup
         backup_path = OLD_DB_PATH + ".migrated"
-        os.rename(OLD_DB_PATH, backup_path)
+        os.replace(OLD_DB_PATH, backup_path)
+        fsync_directory(os.path.dirname(OLD_DB_PATH))
         print(f"[QUOTA MIGRATION] Old database backed up to {backup_path}")
 
         stats["status"] = "success"
@@ -222,11 +225,6 @@ def _parse_datetime(value) -> datetime | None:
     return None
 
 
-def _mark_migration_complete():
-    """Create a marker file to indicate migration is complete."""
-    Path(MIGRATION_MARKER).touch()
-
-
 if __name__ == "__main__":
     # CLI usage for manual migration
     import sys
@@ -28,7 +28,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text, func
+from sqlalchemy import BigInteger, Boolean, DateTime, Index, Integer, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.database import Base
@@ -41,7 +41,7 @@ class UserQuota(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     username: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
-    balance: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    balance: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
     unlimited: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     created_at: Mapped[datetime | None] = mapped_column(DateTime, default=func.now())
     updated_at: Mapped[datetime | None] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
@@ -53,13 +53,13 @@ class QuotaTransaction(Base):
     __tablename__ = "quota_transactions"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    username: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
-    amount: Mapped[int] = mapped_column(Integer, nullable=False)
+    username: Mapped[str] = mapped_column(String(255), nullable=False)
+    amount: Mapped[int] = mapped_column(BigInteger, nullable=False)
     transaction_type: Mapped[str] = mapped_column(String(50), nullable=False)
     resource_type: Mapped[str | None] = mapped_column(String(100))
     description: Mapped[str | None] = mapped_column(Text)
-    balance_before: Mapped[int] = mapped_column(Integer, nullable=False)
-    balance_after: Mapped[int] = mapped_column(Integer, nullable=False)
+    balance_before: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    balance_after: Mapped[int] = mapped_column(BigInteger, nullable=False)
     created_at: Mapped[datetime | None] = mapped_column(DateTime, default=func.now(), index=True)
     created_by: Mapped[str | None] = mapped_column(String(255))
 
@@ -76,9 +76,19 @@ class UsageSession(Base):
     end_time: Mapped[datetime | None] = mapped_column(DateTime)
     duration_minutes: Mapped[int | None] = mapped_column(Integer)
     quota_consumed: Mapped[int | None] = mapped_column(Integer)
-    status: Mapped[str | None] = mapped_column(String(20), default="active", index=True)
+    status: Mapped[str | None] = mapped_column(String(20), default="active")
     created_at: Mapped[datetime | None] = mapped_column(DateTime, default=func.now())
 
 
-# Add composite index for status queries
-Index("idx_usage_sessions_username_status", UsageSession.username, UsageSession.status)
+# Partial index over active sessions only (the rows every status query looks for). Dialects
+# without partial indexes (MySQL) get a plain (status, username) index, which still serves them.
+Index(
+    "idx_usage_sessions_active",
+    UsageSession.status,
+    UsageSession.username,
+    postgresql_where=text("status = 'active'"),
+    sqlite_where=text("status = 'active'"),
+)
+
+# Per-user transaction history (WHERE username = ? ORDER BY created_at DESC); also serves username lookups
+Index("idx_quota_tx_username_created", QuotaTransaction.username, QuotaTransaction.created_at)
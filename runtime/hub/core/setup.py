@@ -39,13 +39,41 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
 from typing import TYPE_CHECKING, Any
 
 import bcrypt
 
 if TYPE_CHECKING:
-    pass
+    from core.quota.manager import QuotaManager
+
+# Child of the "JupyterHub" app logger so records reach its handlers (it does not propagate to root)
+log = logging.getLogger("JupyterHub.setup")
+
+# Seconds after startup before stale quota sessions are cleaned up
+QUOTA_CLEANUP_DELAY = 5
+
+
+def _cleanup_quota_sessions(quota_manager: QuotaManager) -> None:
+    """Close stale usage sessions left over from before a restart and report active ones."""
+    try:
+        stale_sessions = quota_manager.cleanup_stale_sessions()
+        if stale_sessions:
+            log.info("[QUOTA] Cleaned up %d stale sessions on startup", len(stale_sessions))
+        active_count = quota_manager.get_active_sessions_count()
+        log.info("[QUOTA] %d active sessions found", active_count)
+    except Exception as e:
+        log.warning("[QUOTA] Failed to clean up stale sessions: %s", e)
+
+
+async def auth_state_hook(spawner, auth_state):
+    """Expose the user's GitHub access token (if any) to the spawner."""
+    if auth_state is None:
+        spawner.github_access_token = None
+        return
+    spawner.github_access_token = auth_state.get("access_token")
 
 
 def setup_hub(c: Any) -> None:
@@ -91,12 +119,6 @@ def setup_hub(c: Any) -> None:
     c.Authenticator.enable_auth_state = True
     c.Authenticator.auth_refresh_age = 3600  # check token refresh every hour
 
-    async def auth_state_hook(spawner, auth_state):
-        if auth_state is None:
-            spawner.github_access_token = None
-            return
-        spawner.github_access_token = auth_state.get("access_token")
-
     c.Spawner.auth_state_hook = auth_state_hook
 
     # Set authenticator based on mode
@@ -122,7 +144,7 @@ async def auth_state_hook(spawner, auth_state):
     # =========================================================================
 
     configure_handlers(
-        accelerator_options={k: v.model_dump() for k, v in config.accelerators.items()},
+        accelerator_options=config.build_accelerator_options(),
         quota_rates=config.build_quota_rates(),
         quota_enabled=config.quota_enabled,
         minimum_quota_to_start=config.quota.minimumToStart,
@@ -131,8 +153,7 @@ async def auth_state_hook(spawner, auth_state):
     if not hasattr(c.JupyterHub, "extra_handlers") or c.JupyterHub.extra_handlers is None:
         c.JupyterHub.extra_handlers = []
 
-    for route, handler in get_handlers():
-        c.JupyterHub.extra_handlers.append((route, handler))
+    c.JupyterHub.extra_handlers.extend(get_handlers())
 
     # =========================================================================
     # Determine Database URL
@@ -166,11 +187,11 @@ async def auth_state_hook(spawner, auth_state):
         from core.authenticators.migrate import migrate_auth_data
 
         if auth_migration_needed():
-            print("[AUTH] Migrating data from old DBM files...")
+            log.info("[AUTH] Migrating data from old DBM files...")
             migrate_auth_data(db_url)
 
     except Exception as e:
-        print(f"[AUTH] Warning: Failed to run auth migration: {e}")
+        log.warning("[AUTH] Failed to run auth migration: %s", e)
 
     # =========================================================================
     # Initialize Quota Manager
@@ -183,17 +204,21 @@ async def auth_state_hook(spawner, auth_state):
 
             # Check and run migration from old quota.sqlite if needed
             if check_migration_needed():
-                print("[QUOTA] Migrating data from old quota.sqlite...")
+                log.info("[QUOTA] Migrating data from old quota.sqlite...")
                 migrate_quota_data(db_url)
 
             quota_manager = init_quota_manager()
-            stale_sessions = quota_manager.cleanup_stale_sessions()
-            if stale_sessions:
-                print(f"[QUOTA] Cleaned up {len(stale_sessions)} stale sessions on startup")
-            active_count = quota_manager.get_active_sessions_count()
-            print(f"[QUOTA] {active_count} active sessions found")
+
+            # Session housekeeping is not needed to serve requests: run it in the background
+            # once the Hub's event loop is up, or inline when no loop is running yet
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                _cleanup_quota_sessions(quota_manager)
+            else:
+                loop.call_later(QUOTA_CLEANUP_DELAY, loop.run_in_executor, None, _cleanup_quota_sessions, quota_manager)
         except Exception as e:
-            print(f"[QUOTA] Warning: Failed to initialize quota manager: {e}")
+            log.warning("[QUOTA] Failed to initialize quota manager: %s", e)
 
     # =========================================================================
     # API Token
@@ -202,7 +227,7 @@ async def auth_state_hook(spawner, auth_state):
     api_token = os.environ.get("JUPYTERHUB_API_TOKEN")
     if api_token:
         c.JupyterHub.api_tokens = {api_token: "admin"}
-        print("[SETUP] API token loaded for admin user")
+        log.info("[SETUP] API token loaded for admin user")
 
     # =========================================================================
     # Template Paths
@@ -220,7 +245,7 @@ async def auth_state_hook(spawner, auth_state):
 
     if admin_password:
         c.Authenticator.admin_users = {admin_username}
-        print(f"[SETUP] Admin user configured: {admin_username}")
+        log.info("[SETUP] Admin user configured: %s", admin_username)
 
         try:
             from core.authenticators.models import UserPassword
@@ -229,7 +254,7 @@ async def auth_state_hook(spawner, auth_state):
             with session_scope() as session:
                 user_pw = session.query(UserPassword).filter_by(username=admin_username).first()
                 if user_pw:
-                    print(f"[SETUP] Admin '{admin_username}' password already set")
+                    log.info("[SETUP] Admin '%s' password already set", admin_username)
                 else:
                     password_hash = bcrypt.hashpw(admin_password.encode(), bcrypt.gensalt())
                     user_pw = UserPassword(
@@ -238,9 +263,9 @@ async def auth_state_hook(spawner, auth_state):
                         force_change=False,
                     )
                     session.add(user_pw)
-                    print(f"[SETUP] Admin '{admin_username}' password set automatically")
+                    log.info("[SETUP] Admin '%s' password set automatically", admin_username)
         except Exception as e:
-            print(f"[SETUP] Warning: Failed to set admin password: {e}")
+            log.warning("[SETUP] Failed to set admin password: %s", e)
 
     # =========================================================================
     # Template Vars
@@ -251,5 +276,5 @@ async def auth_state_hook(spawner, auth_state):
     c.JupyterHub.template_vars["authenticator_mode"] = config.auth_mode  # type: ignore[assignment]
     c.JupyterHub.template_vars["hide_logout"] = config.auth_mode == "auto-login"  # type: ignore[assignment]
 
-    print(f"[SETUP] Hub setup complete: auth_mode={config.auth_mode}")
-    print(f"[SETUP] template_vars: {c.JupyterHub.template_vars}")
+    log.info("[SETUP] Hub setup complete: auth_mode=%s", config.auth_mode)
+    log.info("[SETUP] template_vars: %s", c.JupyterHub.template_vars)
@@ -25,13 +25,23 @@
 future standalone deployment.
 """
 
+from functools import lru_cache
+
 from core.spawner.kubernetes import RemoteLabKubeSpawner
 
 __all__ = [
     "RemoteLabKubeSpawner",
 ]
 
+# Platform -> spawner class. None marks a known platform that is not implemented yet.
+_SPAWNERS: dict[str, type | None] = {
+    "kubernetes": RemoteLabKubeSpawner,
+    # Future: from core.spawner.standalone import RemoteLabLocalSpawner
+    "standalone": None,
+}
+
 
+@lru_cache
 def create_spawner(platform: str = "kubernetes"):
     """
     Factory function to create the appropriate spawner class.
@@ -42,10 +52,9 @@ def create_spawner(platform: str = "kubernetes"):
     Returns:
         Spawner class (not instance)
     """
-    if platform == "kubernetes":
-        return RemoteLabKubeSpawner
-    elif platform == "standalone":
-        # Future: from core.spawner.standalone import RemoteLabLocalSpawner
-        raise NotImplementedError("Standalone spawner not yet implemented")
-    else:
+    if platform not in _SPAWNERS:
         raise ValueError(f"Unknown platform: {platform}")
+    spawner_class = _SPAWNERS[platform]
+    if spawner_class is None:
+        raise NotImplementedError(f"{platform.capitalize()} spawner not yet implemented")
+    return spawner_class
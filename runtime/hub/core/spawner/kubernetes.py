@@ -28,20 +28,32 @@
 import asyncio
 import base64
 import contextlib
+import hashlib
 import json
+import logging
 import os
 import re
 import time
+from collections.abc import Mapping
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlunparse
 
 import aiohttp
 from jupyterhub.user import User as JupyterHubUser
 from kubespawner import KubeSpawner
 from tornado import web
 
+from core.quota import get_quota_manager
+
 if TYPE_CHECKING:
     from core.config import HubConfig
+    from core.quota import QuotaManager
+
+# Child of the "JupyterHub" app logger so records reach its handlers (it does not propagate to root)
+log = logging.getLogger("JupyterHub.spawner.remotelab")
 
 
 # NPU Security Config
@@ -55,6 +67,142 @@
         }
     }
 }
+_NPU_EXTRA_CONTAINER_CONFIG = NPU_SECURITY_CONFIG["extra_container_config"]
+
+# Resources that need the NPU security config and a root login shell
+_NPU_RESOURCE_TYPES = frozenset({"Tutorial-NPU-Resnet", "ROSCON2025-GPU", "ROSCON2025-NPU"})
+
+# Repository URL / branch validation patterns
+_REPO_TREE_PATH_RE = re.compile(r"^(/[^/]+/[^/]+)/tree/.+$")
+_REPO_URL_BRANCH_RE = re.compile(r"^https?://[^/]+/[^/]+/[^/]+/tree/(.+)$")
+_SAFE_BRANCH_RE = re.compile(r"^[a-zA-Z0-9_./-]+$")
+_REPO_NAME_SANITIZER_RE = re.compile(r"[^a-zA-Z0-9_.-]")
+_USERNAME_SANITIZER_RE = re.compile(r"[^a-z0-9-]")
+# Shell metacharacters that must never reach the clone script
+_DANGEROUS_URL_RE = re.compile(r"[;`\n\r]|\|\||&&|\$\(")
+
+# Compact JSON encoder for values injected into the options form
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+# Memory unit suffix -> multiplier to GB
+_MEMORY_UNITS: Mapping[str, float] = MappingProxyType(
+    {
+        "Ki": 1 / 1024 / 1024,
+        "Mi": 1 / 1024,
+        "Gi": 1,
+        "Ti": 1024,
+        "K": 1 / 1000 / 1000,
+        "M": 1 / 1000,
+        "G": 1,
+        "T": 1000,
+    }
+)
+
+GIT_CLONE_SCRIPT_PATH = os.path.join(os.path.dirname(__file__), "..", "scripts", "git-clone.sh")
+
+# Static part of the git clone init container spec. Per-spawn fields (image,
+# command, env, volumeMounts) are set on a shallow copy; nested dicts are shared
+# and must not be mutated.
+_GIT_INIT_CONTAINER_TEMPLATE: dict[str, Any] = {
+    "name": "init-clone-repo",
+    "imagePullPolicy": "IfNotPresent",
+    "securityContext": {
+        "runAsUser": 1000,
+        "runAsNonRoot": True,
+        "allowPrivilegeEscalation": False,
+    },
+    "resources": {
+        "requests": {"memory": "128Mi", "cpu": "100m"},
+        "limits": {"memory": "256Mi", "cpu": "300m"},
+    },
+}
+
+
+@lru_cache(maxsize=4)
+def _encoded_clone_script(script_path: str) -> str:
+    """
+    Return the base64-encoded git clone script.
+
+    The script is static (per-spawn values are passed as environment
+    variables), so it is read and encoded once per process.
+    """
+    with open(script_path, "rb") as f:
+        return base64.b64encode(f.read()).decode()
+
+
+@lru_cache(maxsize=4)
+def _load_form_template(template_file: str, mtime_ns: int, single_node_mode: bool) -> tuple[str, str | None]:
+    """
+    Read the resource options form template and pre-render the injected script.
+
+    Cached by file modification time, so the template is only re-read from
+    disk when it changes. Everything except the per-user resource list is
+    fixed, so this returns ``(prefix, suffix)`` to be joined around the
+    resource JSON; ``suffix`` is None if the template has no head tag, in
+    which case ``prefix`` is the template unchanged.
+    """
+    with open(template_file, encoding="utf-8") as f:
+        html_content = f.read()
+    head, sep, rest = html_content.partition("</head>")
+    if not sep:
+        return html_content, None
+
+    single_node_mode_js = "true" if single_node_mode else "false"
+    prefix = f"""{head}
+<script>
+    window.AVAILABLE_RESOURCES = """
+    suffix = f""";
+    window.SINGLE_NODE_MODE = {single_node_mode_js};
+</script>
+</head>{rest}"""
+    return prefix, suffix
+
+
+@lru_cache(maxsize=128)
+def _encode_resource_names(resource_names: tuple[str, ...]) -> str:
+    """JSON-encode a resource list; users mostly share a few distinct lists."""
+    return _encode_json(resource_names)
+
+
+def _memory_to_gb(memory_str: str) -> float | None:
+    """Convert a stripped memory string ("16Gi", "512M", "8") to GB, or None if malformed."""
+    # Dispatch on the suffix directly: binary units (two chars) first, then decimal;
+    # plain numbers miss both lookups and are handled by the float() fallback
+    for unit in (memory_str[-2:], memory_str[-1:]):
+        multiplier = _MEMORY_UNITS.get(unit)
+        if multiplier is not None:
+            try:
+                return float(memory_str[: -len(unit)]) * multiplier
+            except ValueError:
+                pass
+
+    try:
+        return float(memory_str)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _parse_memory_cached(memory_str: str) -> float:
+    """
+    Convert a stripped memory string to GB.
+
+    Resource requirements only use a handful of distinct values ("4Gi",
+    "16Gi", ...), so results are memoized per string.
+    """
+    memory_gb = _memory_to_gb(memory_str)
+    if memory_gb is None:
+        log.warning("Could not parse memory value %r, defaulting to 1GB", memory_str)
+        return 1.0
+    return memory_gb
+
+
+def _gi_to_g(memory_str: str) -> str:
+    """Rewrite a "<n>Gi" quantity as "<n>G" for KubeSpawner; other values pass through."""
+    numeric_part = memory_str.removesuffix("Gi")
+    if len(numeric_part) == len(memory_str):
+        return memory_str
+    return f"{float(numeric_part)}G"
 
 
 class RemoteLabKubeSpawner(KubeSpawner):
@@ -81,26 +229,49 @@ class RemoteLabKubeSpawner(KubeSpawner):
     quota_enabled: bool | None = False
 
     # Resource configuration (set from config)
-    resource_images: dict[str, str] = {}
-    resource_requirements: dict[str, dict] = {}
-    accelerator_options: dict[str, dict] = {}
-    team_resource_mapping: dict[str, list[str]] = {}
-    node_selector_mapping: dict[str, dict[str, str]] = {}
-    environment_mapping: dict[str, dict[str, str]] = {}
+    # Read-only views over HubConfig's memoized builds, shared by every spawner instance
+    resource_images: Mapping[str, str] = MappingProxyType({})
+    resource_requirements: Mapping[str, dict] = MappingProxyType({})
+    _resource_mem: dict[str, tuple[str, str]] = {}
+    _resource_cpu: dict[str, tuple[float, float]] = {}
+    accelerator_options: Mapping[str, dict] = MappingProxyType({})
+    team_resource_mapping: Mapping[str, list[str]] = MappingProxyType({})
+    _team_names: frozenset[str] = frozenset()
+    _team_order: dict[str, int] = {}
+    node_selector_mapping: Mapping[str, dict[str, str]] = MappingProxyType({})
+    environment_mapping: Mapping[str, dict[str, str]] = MappingProxyType({})
+    _node_affinity_mapping: dict[str, dict[str, Any]] = {}
 
     # Quota settings
-    quota_rates: dict[str, int] = {}
+    quota_rates: Mapping[str, int] = MappingProxyType({})
+    _cpu_quota_rate: int = 1
     default_quota: int = 0
     minimum_quota_to_start: int = 10
 
     # Repository cloning configuration (populated from HubConfig.git_clone)
-    ALLOWED_GIT_PROVIDERS: set[str] = set()
+    ALLOWED_GIT_PROVIDERS: frozenset[str] = frozenset()
     MAX_CLONE_TIMEOUT: int = 0
     GIT_INIT_CONTAINER_IMAGE: str = ""
     GITHUB_APP_NAME: str = ""
     DEFAULT_ACCESS_TOKEN: bool = False
     DEFAULT_ACCESS_TOKEN_SECRET: str = "jupyterhub-git-default-token"
 
+    # Options form template stat cache: (path, checked_at, mtime_ns or None if missing)
+    TEMPLATE_RECHECK_INTERVAL: int = 60
+    _template_stat: tuple[str, float, int | None] | None = None
+
+    # Quota manager (resolved on first use; initialized after the spawner is configured)
+    _quota_manager: QuotaManager | None = None
+
+    # Shared HTTP session for GitHub API calls (created lazily on the hub event loop)
+    _gh_session: aiohttp.ClientSession | None = None
+    _GITHUB_HEADERS_BASE: dict[str, str] = {"Accept": "application/vnd.github.v3+json"}
+
+    # GitHub team membership cache: username -> (token_hash, fetched_at, etag, team_slugs)
+    TEAMS_CACHE_TTL: int = 300
+    _teams_cache: dict[str, tuple[str, float, str | None, list[str]]] = {}
+    _teams_inflight: dict[tuple[str, str], asyncio.Future[list[str]]] = {}
+
     @classmethod
     def configure_from_config(cls, config: HubConfig) -> None:
         """
@@ -116,21 +287,35 @@ def configure_from_config(cls, config: HubConfig) -> None:
         cls.github_org_name = config.github_org_name
 
         # Extract resource images and requirements
-        cls.resource_images = dict(config.resources.images)
-        cls.resource_requirements = {
-            k: v.model_dump(by_alias=True, exclude_none=True) for k, v in config.resources.requirements.items()
-        }
+        cls.resource_images = MappingProxyType(config.build_resource_images())
+        cls.resource_requirements = MappingProxyType(config.build_resource_requirements())
+
+        # Normalize CPU and memory settings once; malformed values are left to fail at spawn time
+        cls._resource_mem = {}
+        cls._resource_cpu = {}
+        for name, requirements in cls.resource_requirements.items():
+            with contextlib.suppress(ValueError):
+                cls._resource_mem[name] = cls._resolve_memory_settings(requirements)
+            with contextlib.suppress(KeyError, TypeError, ValueError):
+                cls._resource_cpu[name] = cls._resolve_cpu_settings(requirements)
 
         # Extract accelerator configuration
-        cls.accelerator_options = {k: v.model_dump() for k, v in config.accelerators.items()}
-        cls.node_selector_mapping = {k: v.nodeSelector for k, v in config.accelerators.items()}
-        cls.environment_mapping = {k: v.env for k, v in config.accelerators.items()}
+        cls.accelerator_options = MappingProxyType(config.build_accelerator_options())
+        cls.node_selector_mapping = MappingProxyType(config.build_node_selector_mapping())
+        cls.environment_mapping = MappingProxyType(config.build_environment_mapping())
+        cls._node_affinity_mapping = {
+            k: {"matchExpressions": [{"key": key, "operator": "In", "values": [value]} for key, value in v.items()]}
+            for k, v in cls.node_selector_mapping.items()
+        }
 
         # Extract team mapping
-        cls.team_resource_mapping = dict(config.teams.mapping)
+        cls.team_resource_mapping = MappingProxyType(config.build_team_resource_mapping())
+        cls._team_names = frozenset(cls.team_resource_mapping)
+        cls._team_order = {team: i for i, team in enumerate(cls.team_resource_mapping)}
 
         # Extract quota settings
-        cls.quota_rates = config.build_quota_rates()
+        cls.quota_rates = MappingProxyType(config.build_quota_rates())
+        cls._cpu_quota_rate = cls.quota_rates.get("cpu", 1)
         cls.default_quota = config.quota.defaultQuota
         cls.minimum_quota_to_start = config.quota.minimumToStart
         cls.quota_enabled = config.quota.enabled
@@ -138,11 +323,32 @@ def configure_from_config(cls, config: HubConfig) -> None:
         # Extract git clone settings (single source of truth: GitCloneSettings)
         git_config = config.git_clone
         cls.GIT_INIT_CONTAINER_IMAGE = git_config.initContainerImage
-        cls.ALLOWED_GIT_PROVIDERS = set(git_config.allowedProviders)
+        cls.ALLOWED_GIT_PROVIDERS = frozenset(git_config.allowedProviders)
         cls.MAX_CLONE_TIMEOUT = git_config.maxCloneTimeout
         cls.GITHUB_APP_NAME = git_config.githubAppName
         cls.DEFAULT_ACCESS_TOKEN = bool(git_config.defaultAccessToken)
 
+    @classmethod
+    def _get_quota_manager(cls) -> QuotaManager:
+        """Return the global QuotaManager, caching the reference on the class."""
+        if cls._quota_manager is None:
+            cls._quota_manager = get_quota_manager()
+        return cls._quota_manager
+
+    @classmethod
+    async def _get_gh_session(cls) -> aiohttp.ClientSession:
+        """Return the shared GitHub API session, creating it on first use.
+
+        Reusing one session keeps connections to api.github.com pooled so
+        spawns do not pay a TCP/TLS handshake for every team lookup.
+        """
+        if cls._gh_session is None or cls._gh_session.closed:
+            cls._gh_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+        return cls._gh_session
+
     async def get_user_teams(self) -> list[str]:
         """
         Get available resources for the user based on their GitHub team membership.
@@ -180,40 +386,25 @@ async def get_user_teams(self) -> list[str]:
             )
             return ["none"]
 
-        access_token = auth_state["access_token"]
-        headers = {
-            "Authorization": f"token {access_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
+        teams = await self._fetch_github_teams(username, auth_state["access_token"])
 
-        teams = []
-        try:
-            async with (
-                aiohttp.ClientSession() as session,
-                session.get("https://api.github.com/user/teams", headers=headers) as resp,
-            ):
-                if resp.status == 200:
-                    data = await resp.json()
-                    for team in data:
-                        if team["organization"]["login"] == self.github_org_name:
-                            teams.append(team["slug"])
-                else:
-                    self.log.debug(f"GitHub API request failed with status {resp.status}")
-        except Exception as e:
-            self.log.debug(f"Error fetching teams: {e}")
+        # Map teams to available resources ("official" grants its full list)
+        matched_teams = self._team_names.intersection(teams)
+        if "official" in matched_teams:
+            matched_lists = [self.team_resource_mapping["official"]]
+        else:
+            # Only the user's configured teams are visited, in configuration order
+            matched_lists = [
+                self.team_resource_mapping[team] for team in sorted(matched_teams, key=self._team_order.__getitem__)
+            ]
 
-        # Map teams to available resources
+        # Remove duplicates while preserving configured team order
+        seen: set[str] = set()
         available_resources = []
-        for team, resources in self.team_resource_mapping.items():
-            if team in teams:
-                if team == "official":
-                    available_resources = self.team_resource_mapping[team]
-                    break
-                else:
-                    available_resources.extend(resources)
-
-        # Remove duplicates while preserving order
-        available_resources = list(dict.fromkeys(available_resources))
+        for resource in chain.from_iterable(matched_lists):
+            if resource not in seen:
+                seen.add(resource)
+                available_resources.append(resource)
 
         # If no teams found, provide basic access
         if not available_resources:
@@ -224,6 +415,90 @@ async def get_user_teams(self) -> list[str]:
 
         return available_resources
 
+    async def _fetch_github_teams(self, username: str, access_token: str) -> list[str]:
+        """
+        Fetch the user's team slugs in the configured GitHub organization.
+
+        Results are cached per user and access token for TEAMS_CACHE_TTL seconds.
+        Once the TTL expires the cached ETag is sent with the request, so an
+        unchanged membership costs a 304 instead of a full response. Concurrent
+        cache misses for the same user share a single in-flight request.
+        """
+        token_hash = hashlib.sha256(access_token.encode()).hexdigest()
+        cached = self._teams_cache.get(username)
+        if cached and cached[0] != token_hash:
+            cached = None
+
+        if cached and time.monotonic() - cached[1] < self.TEAMS_CACHE_TTL:
+            self.log.debug(f"Using cached GitHub teams for {username}")
+            return cached[3]
+
+        inflight_key = (username, token_hash)
+        task = self._teams_inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(self._request_github_teams(username, access_token, token_hash, cached))
+            self._teams_inflight[inflight_key] = task
+            task.add_done_callback(lambda _: self._teams_inflight.pop(inflight_key, None))
+        else:
+            self.log.debug(f"Joining in-flight GitHub teams request for {username}")
+
+        # Shield so a cancelled spawn does not cancel the request shared with other waiters
+        return await asyncio.shield(task)
+
+    async def _request_github_teams(
+        self,
+        username: str,
+        access_token: str,
+        token_hash: str,
+        cached: tuple[str, float, str | None, list[str]] | None,
+    ) -> list[str]:
+        """Request /user/teams from GitHub and refresh the team membership cache."""
+        now = time.monotonic()
+        headers = {**self._GITHUB_HEADERS_BASE, "Authorization": f"token {access_token}"}
+        if cached and cached[2]:
+            headers["If-None-Match"] = cached[2]
+
+        teams = []
+        try:
+            session = await self._get_gh_session()
+            # per_page=100 (the API maximum) avoids truncating members of many teams at the default 30
+            async with session.get(
+                "https://api.github.com/user/teams", headers=headers, params={"per_page": "100"}
+            ) as resp:
+                if resp.status == 304 and cached:
+                    teams = cached[3]
+                    self._teams_cache[username] = (token_hash, now, cached[2], teams)
+                elif resp.status == 200:
+                    org_name = self.github_org_name
+                    teams = [team["slug"] for team in await resp.json() if team["organization"]["login"] == org_name]
+                    self._teams_cache[username] = (token_hash, now, resp.headers.get("ETag"), teams)
+                else:
+                    self.log.debug(f"GitHub API request failed with status {resp.status}")
+        except Exception as e:
+            self.log.debug(f"Error fetching teams: {e}")
+
+        return teams
+
+    @classmethod
+    def _get_template_mtime(cls, template_file: str) -> int | None:
+        """
+        Return the template's mtime_ns, or None if it does not exist.
+
+        The result (including a missing template) is reused for
+        TEMPLATE_RECHECK_INTERVAL seconds before the file is stat'ed again.
+        """
+        now = time.monotonic()
+        cached = cls._template_stat
+        if cached and cached[0] == template_file and now - cached[1] < cls.TEMPLATE_RECHECK_INTERVAL:
+            return cached[2]
+
+        try:
+            mtime_ns: int | None = os.stat(template_file).st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        cls._template_stat = (template_file, now, mtime_ns)
+        return mtime_ns
+
     async def options_form(self, _) -> str:
         """Generate the HTML form for resource selection."""
         try:
@@ -234,21 +509,16 @@ async def options_form(self, _) -> str:
             template_path = os.environ.get("JUPYTERHUB_TEMPLATE_PATH", "/srv/jupyterhub/templates")
             template_file = os.path.join(template_path, "resource_options_form.html")
 
-            if os.path.exists(template_file):
-                with open(template_file, encoding="utf-8") as f:
-                    html_content = f.read()
+            mtime_ns = self._get_template_mtime(template_file)
+            if mtime_ns is not None:
+                prefix, suffix = _load_form_template(template_file, mtime_ns, self.single_node_mode)
 
                 # Inject available resources and config from backend
-                available_resources_js = json.dumps(available_resource_names)
-                single_node_mode_js = "true" if self.single_node_mode else "false"
-                injection_script = f"""
-<script>
-    window.AVAILABLE_RESOURCES = {available_resources_js};
-    window.SINGLE_NODE_MODE = {single_node_mode_js};
-</script>
-</head>"""
-
-                html_content = html_content.replace("</head>", injection_script)
+                html_content = (
+                    prefix
+                    if suffix is None
+                    else f"{prefix}{_encode_resource_names(tuple(available_resource_names))}{suffix}"
+                )
 
                 self.log.debug(f"Successfully loaded template from {template_file}")
                 return html_content
@@ -267,17 +537,19 @@ async def options_form(self, _) -> str:
 
     def _generate_fallback_form(self, available_resource_names: list[str]) -> str:
         """Generate a simple fallback form if template is not available."""
-        options_html = ""
+        option_parts = []
+        resource_images = self.resource_images
+        resource_requirements = self.resource_requirements
 
         for i, resource_name in enumerate(available_resource_names):
-            if resource_name in self.resource_images:
-                requirements = self.resource_requirements.get(resource_name, {})
+            if resource_name in resource_images:
+                requirements = resource_requirements.get(resource_name, {})
                 cpu = requirements.get("cpu", "2")
                 memory = requirements.get("memory", "4Gi").replace("Gi", "GB")
 
                 checked = "checked" if i == 0 else ""
 
-                options_html += f"""
+                option_parts.append(f"""
                 <div style="margin-bottom: 12px; padding: 12px; border: 1px solid #e0e0e0; border-radius: 8px; background: white;">
                     <label style="display: flex; align-items: center; cursor: pointer;">
                         <input type="radio" name="resource_type" value="{resource_name}" {checked}
@@ -290,8 +562,9 @@ def _generate_fallback_form(self, available_resource_names: list[str]) -> str:
                         </div>
                     </label>
                 </div>
-                """
+                """)
 
+        options_html = "".join(option_parts)
         if not options_html:
             options_html = """
             <div style="padding: 20px; background: #fff3cd; border: 1px solid #ffeaa7; border-radius: 8px; color: #856404;">
@@ -329,16 +602,15 @@ def options_from_form(self, formdata) -> dict[str, Any]:
             raise RuntimeError(f"Selected 0 or more than 1 resources! {resource_type_list}")
 
         resource_type = resource_type_list[0]
+        # Validate resource type before reading any per-resource fields
+        if resource_type not in self.resource_images:
+            raise RuntimeError(f"Unknown Resource: {resource_type}")
         options["resource_type"] = resource_type
 
         # Parse GPU selection if available
         gpu_selection = formdata.get(f"gpu_selection_{resource_type}", [None])[0]
         options["gpu_selection"] = gpu_selection
 
-        # Validate resource type
-        if resource_type not in self.resource_images:
-            raise RuntimeError(f"Unknown Resource: {resource_type}")
-
         # Configure spawner based on selections
         self._configure_spawner(resource_type, gpu_selection)
 
@@ -364,11 +636,11 @@ def options_from_form(self, formdata) -> dict[str, Any]:
 
         return options
 
-    def _validate_and_sanitize_repo_url(self, url: str) -> tuple[bool, str, str]:
+    def _validate_and_sanitize_repo_url(self, url: str) -> tuple[bool, str, str, str]:
         """
         Validate and normalize a repository URL.
-        Returns (is_valid, error_message, sanitized_url).
-        Empty/blank URLs return (True, "", "").
+        Returns (is_valid, error_message, sanitized_url, sanitized_path).
+        Empty/blank URLs return (True, "", "", "").
 
         Normalization applied (mirrors frontend logic):
         - Prepends https:// if no scheme present
@@ -376,7 +648,7 @@ def _validate_and_sanitize_repo_url(self, url: str) -> tuple[bool, str, str]:
         - Strips trailing .git suffix
         """
         if not url or not str(url).strip():
-            return True, "", ""
+            return True, "", "", ""
 
         url = str(url).strip()
 
@@ -387,14 +659,14 @@ def _validate_and_sanitize_repo_url(self, url: str) -> tuple[bool, str, str]:
         try:
             parsed = urlparse(url)
             if parsed.scheme not in ["http", "https"]:
-                return False, "Only HTTP/HTTPS URLs supported", ""
+                return False, "Only HTTP/HTTPS URLs supported", "", ""
             if not parsed.netloc:
-                return False, "Invalid URL format", ""
+                return False, "Invalid URL format", "", ""
 
             path = parsed.path
 
             # Strip /tree/<branch> path component
-            tree_match = re.match(r"^(/[^/]+/[^/]+)/tree/.+$", path)
+            tree_match = _REPO_TREE_PATH_RE.match(path)
             if tree_match:
                 path = tree_match.group(1)
 
@@ -403,33 +675,33 @@ def _validate_and_sanitize_repo_url(self, url: str) -> tuple[bool, str, str]:
                 path = path[:-4]
 
             # Reconstruct without query/fragment
-            from urllib.parse import urlunparse
-
             url = urlunparse((parsed.scheme, parsed.netloc, path, "", "", ""))
 
             hostname = parsed.netloc.lower()
-            is_whitelisted = any(
-                hostname == provider or hostname.endswith("." + provider) for provider in self.ALLOWED_GIT_PROVIDERS
-            )
-            if not is_whitelisted:
-                return False, f"Repository host '{hostname}' not authorized", ""
+            if not self._is_allowed_git_host(hostname):
+                return False, f"Repository host '{hostname}' not authorized", "", ""
 
         except Exception as e:
-            return False, f"URL parsing error: {e}", ""
+            return False, f"URL parsing error: {e}", "", ""
+
+        if _DANGEROUS_URL_RE.search(url):
+            return False, "URL contains suspicious characters", "", ""
 
-        dangerous_patterns = [";", "||", "&&", "$(", "`", "\n", "\r"]
-        if any(pat in url for pat in dangerous_patterns):
-            return False, "URL contains suspicious characters", ""
+        return True, "", url, path
 
-        return True, "", url
+    def _is_allowed_git_host(self, hostname: str) -> bool:
+        """Check whether hostname is an allowed provider or a subdomain of one."""
+        if hostname in self.ALLOWED_GIT_PROVIDERS:
+            return True
+        labels = hostname.split(".")
+        return any(".".join(labels[i:]) in self.ALLOWED_GIT_PROVIDERS for i in range(1, len(labels)))
 
-    def _extract_repo_name(self, url: str) -> str:
-        """Extract and sanitize a directory name from a git repo URL."""
-        path = urlparse(url).path.rstrip("/")
-        name = path.split("/")[-1]
+    def _extract_repo_name(self, path: str) -> str:
+        """Extract and sanitize a directory name from a git repo URL path."""
+        name = path.rstrip("/").rsplit("/", 1)[-1]
         if name.endswith(".git"):
             name = name[:-4]
-        name = re.sub(r"[^a-zA-Z0-9_.-]", "_", name)
+        name = _REPO_NAME_SANITIZER_RE.sub("_", name)
         return name or "repo"
 
     def _get_home_mount_path(self, home_volume_name: str) -> str:
@@ -450,7 +722,7 @@ async def _create_git_token_secret(self, access_token: str) -> str:
         from kubernetes_asyncio import client as k8s_client
         from kubernetes_asyncio.client import ApiClient
 
-        safe_username = re.sub(r"[^a-z0-9-]", "-", self.user.name.lower())[:40]
+        safe_username = _USERNAME_SANITIZER_RE.sub("-", self.user.name.lower())[:40]
         suffix = _secrets.token_hex(3)
         secret_name = f"git-token-{safe_username}-{suffix}"
 
@@ -481,7 +753,7 @@ async def _cleanup_git_token_secrets(self) -> None:
             from kubernetes_asyncio import client as k8s_client
             from kubernetes_asyncio.client import ApiClient
 
-            safe_username = re.sub(r"[^a-z0-9-]", "-", self.user.name.lower())[:40]
+            safe_username = _USERNAME_SANITIZER_RE.sub("-", self.user.name.lower())[:40]
             label_selector = f"component=git-token,hub.jupyter.org/username={safe_username}"
             async with ApiClient() as api_client:
                 v1 = k8s_client.CoreV1Api(api_client)
@@ -515,9 +787,7 @@ async def _build_git_init_container(
         at runtime to prevent KubeSpawner's _expand_all from treating shell braces as
         Python format string placeholders. Variables are passed as environment variables.
         """
-        script_path = os.path.join(os.path.dirname(__file__), "..", "scripts", "git-clone.sh")
-        with open(script_path, "rb") as f:
-            encoded = base64.b64encode(f.read()).decode()
+        encoded = _encoded_clone_script(GIT_CLONE_SCRIPT_PATH)
 
         clone_dir = f"{home_mount_path}/{repo_name}"
 
@@ -555,64 +825,44 @@ async def _build_git_init_container(
                 }
             )
 
-        return {
-            "name": "init-clone-repo",
-            "image": self.GIT_INIT_CONTAINER_IMAGE,
-            "imagePullPolicy": "IfNotPresent",
-            "command": ["sh", "-c", f"echo {encoded} | base64 -d | sh"],
-            "env": env,
-            "volumeMounts": [{"name": home_volume_name, "mountPath": home_mount_path}],
-            "securityContext": {
-                "runAsUser": 1000,
-                "runAsNonRoot": True,
-                "allowPrivilegeEscalation": False,
-            },
-            "resources": {
-                "requests": {"memory": "128Mi", "cpu": "100m"},
-                "limits": {"memory": "256Mi", "cpu": "300m"},
-            },
-        }
+        spec = dict(_GIT_INIT_CONTAINER_TEMPLATE)
+        spec["image"] = self.GIT_INIT_CONTAINER_IMAGE
+        spec["command"] = ["sh", "-c", f"echo {encoded} | base64 -d | sh"]
+        spec["env"] = env
+        spec["volumeMounts"] = [{"name": home_volume_name, "mountPath": home_mount_path}]
+        return spec
 
-    def _parse_memory_string(self, memory_str) -> float:
+    @staticmethod
+    def _parse_memory_string(memory_str) -> float:
         """Parse memory string with units like '16Gi' or '512Mi' to float in GB."""
         if isinstance(memory_str, (int, float)):
             return float(memory_str)
+        return _parse_memory_cached(str(memory_str).strip())
 
-        memory_str = str(memory_str).strip()
+    def get_quota_rate(self, accelerator_type: str | None) -> int:
+        """Get quota rate based on accelerator type."""
+        return self.quota_rates.get(accelerator_type or "cpu", self._cpu_quota_rate)
 
-        if memory_str.isdigit():
-            return float(memory_str)
+    @staticmethod
+    def _resolve_cpu_settings(requirements: dict) -> tuple[float, float]:
+        """Derive (cpu_guarantee, cpu_limit) for KubeSpawner; the limit adds a 25% buffer."""
+        cpu = float(requirements["cpu"])
+        return cpu, cpu * 1.25
 
-        units = {
-            "Ki": 1 / 1024 / 1024,
-            "Mi": 1 / 1024,
-            "Gi": 1,
-            "Ti": 1024,
-            "K": 1 / 1000 / 1000,
-            "M": 1 / 1000,
-            "G": 1,
-            "T": 1000,
-        }
-
-        for unit, multiplier in units.items():
-            if memory_str.endswith(unit):
-                try:
-                    value = float(memory_str[: -len(unit)])
-                    return value * multiplier
-                except ValueError:
-                    pass
+    @staticmethod
+    def _resolve_memory_settings(requirements: dict) -> tuple[str, str]:
+        """Derive (mem_guarantee, mem_limit) for KubeSpawner from resource requirements."""
+        memory_str = requirements["memory"]
+        mem_guarantee = _gi_to_g(memory_str)
 
-        try:
-            return float(memory_str)
-        except ValueError:
-            print(f"Warning: Could not parse memory value '{memory_str}', defaulting to 1GB")
-            return 1.0
+        if "memory_limit" in requirements:
+            mem_limit = _gi_to_g(requirements["memory_limit"])
+        else:
+            # Default limit is 1.5x the request; unparseable values are passed through as-is
+            memory_gb = _memory_to_gb(memory_str)
+            mem_limit = f"{memory_gb * 1.5}G" if memory_gb is not None else memory_str
 
-    def get_quota_rate(self, accelerator_type: str | None) -> int:
-        """Get quota rate based on accelerator type."""
-        if not accelerator_type:
-            return self.quota_rates.get("cpu", 1)
-        return self.quota_rates.get(accelerator_type, self.quota_rates.get("cpu", 1))
+        return mem_guarantee, mem_limit
 
     def _configure_spawner(self, resource_type: str, gpu_selection: str | None = None) -> None:
         """Configure the spawner based on the resource type and GPU selection."""
@@ -634,43 +884,17 @@ def _configure_spawner(self, resource_type: str, gpu_selection: str | None = Non
         # Set resource requirements
         requirements = self.resource_requirements[resource_type]
 
-        # Set CPU guarantee and limit
-        self.cpu_guarantee = float(requirements["cpu"])
-        self.cpu_limit = float(requirements["cpu"]) * 1.25  # Add 25% buffer
+        # CPU guarantee/limit (precomputed per resource in configure_from_config)
+        cpu_settings = self._resource_cpu.get(resource_type)
+        if cpu_settings is None:
+            cpu_settings = self._resolve_cpu_settings(requirements)
+        self.cpu_guarantee, self.cpu_limit = cpu_settings
 
-        # Handle memory values
-        memory_str = requirements["memory"]
-
-        if memory_str.endswith("Gi"):
-            numeric_part = float(memory_str[:-2])
-            self.mem_guarantee = f"{numeric_part}G"
-        else:
-            self.mem_guarantee = memory_str
-
-        # Handle memory limit
-        if "memory_limit" in requirements:
-            limit_str = requirements["memory_limit"]
-            if limit_str.endswith("Gi"):
-                limit_numeric = float(limit_str[:-2])
-                self.mem_limit = f"{limit_numeric}G"
-            else:
-                self.mem_limit = limit_str
-        else:
-            if memory_str.endswith("Gi"):
-                numeric_part = float(memory_str[:-2])
-                limit_value = numeric_part * 1.5
-                self.mem_limit = f"{limit_value}G"
-            else:
-                try:
-                    match = re.match(r"^([\d.]+)", memory_str)
-                    if match:
-                        numeric_part = float(match.group(1))
-                        limit_value = numeric_part * 1.5
-                        self.mem_limit = f"{limit_value}G"
-                    else:
-                        self.mem_limit = memory_str
-                except Exception:
-                    self.mem_limit = memory_str
+        # Memory guarantee/limit (precomputed per resource in configure_from_config)
+        memory_settings = self._resource_mem.get(resource_type)
+        if memory_settings is None:
+            memory_settings = self._resolve_memory_settings(requirements)
+        self.mem_guarantee, self.mem_limit = memory_settings
 
         # GPU/NPU resources
         if "amd.com/gpu" in requirements:
@@ -680,15 +904,8 @@ def _configure_spawner(self, resource_type: str, gpu_selection: str | None = Non
             self.log.debug("NPU DEVICE PLUGIN are removed, amd.com/npu is no more needed")
 
         # Configure node affinity based on GPU selection
-        if gpu_selection and gpu_selection in self.node_selector_mapping:
-            node_selector = self.node_selector_mapping[gpu_selection]
-
-            node_affinity = {
-                "matchExpressions": [
-                    {"key": key, "operator": "In", "values": [value]} for key, value in node_selector.items()
-                ]
-            }
-
+        if gpu_selection and gpu_selection in self._node_affinity_mapping:
+            node_affinity = self._node_affinity_mapping[gpu_selection]
             self.node_affinity_required = [node_affinity]
             self.log.debug(f"Set node affinity for GPU {gpu_selection}: {node_affinity}")
 
@@ -726,11 +943,9 @@ def _configure_spawner(self, resource_type: str, gpu_selection: str | None = Non
                         )
 
         # Special configuration for NPU resources
-        if resource_type in ["Tutorial-NPU-Resnet", "ROSCON2025-GPU", "ROSCON2025-NPU"]:
+        if resource_type in _NPU_RESOURCE_TYPES:
             self.log.debug(f"Set node affinity for NPU {resource_type}")
-            for key, value in NPU_SECURITY_CONFIG.items():
-                if hasattr(self, key):
-                    setattr(self, key, value)
+            self.extra_container_config = _NPU_EXTRA_CONTAINER_CONFIG
 
             self.cmd = ["/bin/bash", "-l", "-c", "jupyterhub-singleuser", "--allow-root"]
 
@@ -750,19 +965,18 @@ async def start(self):
 
         # Quota check (if enabled)
         if self.quota_enabled:
-            from core.quota import get_quota_manager
-
-            quota_manager = get_quota_manager()
+            quota_manager = self._get_quota_manager()
 
-            # Check if user has unlimited quota
-            has_unlimited = quota_manager.is_unlimited_in_db(username)
+            # Check if user has unlimited quota (DB calls run off the event loop)
+            has_unlimited = await asyncio.to_thread(quota_manager.is_unlimited_in_db, username)
 
             if has_unlimited:
-                print(f"[QUOTA] User {username} has unlimited quota, skipping quota check")
+                self.log.info("[QUOTA] User %s has unlimited quota, skipping quota check", username)
                 self.usage_session_id = None
                 self._has_unlimited_quota = True
             else:
-                can_start, message, estimated_cost = quota_manager.can_start_container(
+                can_start, message, estimated_cost = await asyncio.to_thread(
+                    quota_manager.can_start_container,
                     username,
                     accelerator_type,
                     runtime_minutes,
@@ -771,17 +985,23 @@ async def start(self):
                 )
 
                 if not can_start:
-                    print(f"[QUOTA] Blocked container start for {username}: {message}")
+                    self.log.warning("[QUOTA] Blocked container start for %s: %s", username, message)
                     raise web.HTTPError(
                         403,
                         f"Cannot start container: {message}. Please contact administrator to add quota.",
                     )
 
                 # Start usage session for tracking
-                self.usage_session_id = quota_manager.start_usage_session(username, accelerator_type)
+                self.usage_session_id = await asyncio.to_thread(
+                    quota_manager.start_usage_session, username, accelerator_type
+                )
                 self._has_unlimited_quota = False
-                print(
-                    f"[QUOTA] Session {self.usage_session_id} started for {username} ({accelerator_type}), estimated cost: {estimated_cost}"
+                self.log.info(
+                    "[QUOTA] Session %s started for %s (%s), estimated cost: %s",
+                    self.usage_session_id,
+                    username,
+                    accelerator_type,
+                    estimated_cost,
                 )
         else:
             self.usage_session_id = None
@@ -833,22 +1053,22 @@ async def start(self):
 
         # Extract branch from URL path if not provided separately (e.g. /owner/repo/tree/main)
         if repo_url and not repo_branch:
-            tree_match = re.match(r"^https?://[^/]+/[^/]+/[^/]+/tree/(.+)$", repo_url)
+            tree_match = _REPO_URL_BRANCH_RE.match(repo_url)
             if tree_match:
                 repo_branch = tree_match.group(1)
 
         # Sanitize branch name: allow only safe characters
-        if repo_branch and not re.match(r"^[a-zA-Z0-9_./-]+$", repo_branch):
+        if repo_branch and not _SAFE_BRANCH_RE.match(repo_branch):
             self.log.warning(f"Invalid branch name for user {self.user.name}: {repo_branch!r}")
             repo_branch = ""
 
         if repo_url:
-            is_valid, err_msg, sanitized_url = self._validate_and_sanitize_repo_url(repo_url)
+            is_valid, err_msg, sanitized_url, sanitized_path = self._validate_and_sanitize_repo_url(repo_url)
             if not is_valid:
                 self.log.warning(f"Repository URL rejected for user {self.user.name}: {err_msg}")
             else:
                 try:
-                    repo_name = self._extract_repo_name(sanitized_url)
+                    repo_name = self._extract_repo_name(sanitized_path)
 
                     safe_username = self._expand_user_properties("{username}")
                     home_volume_name = f"volume-{safe_username}"
@@ -904,17 +1124,60 @@ async def start(self):
         # In single-node mode, skip auto-shutdown timer
         if self.single_node_mode:
             self.shutdown_time = None
-            self.check_timer = None
+            self._shutdown_timers = []
             self.log.debug(f"Container for {self.user.name} started (single-node mode, no time limit)")
         else:
             self.shutdown_time = start_time + (runtime_minutes * 60)
-            loop = asyncio.get_event_loop()
-            self.check_timer = loop.call_later(60, self.check_timeout)
+            self._schedule_shutdown(runtime_minutes)
             self.log.debug(f"Container for {self.user.name} started at {time.ctime(self.start_time)}")
             self.log.debug(f"Scheduled shutdown after {runtime_minutes} minutes at {time.ctime(self.shutdown_time)}")
 
         return start_result
 
+    def _schedule_shutdown(self, runtime_minutes: int) -> None:
+        """
+        Schedule the automatic shutdown and the "minutes remaining" log lines.
+
+        All timers are armed once on the event loop's monotonic clock, instead of
+        polling every minute; stop() cancels whatever has not fired yet. The log
+        timers are only armed when debug logging is enabled.
+
+        The deadline is self.shutdown_time (measured from before the pod started,
+        like the usage session and JOB_START_TIME), so pod startup time counts
+        against the requested runtime.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        deadline = now + (self.shutdown_time - time.time())
+        self._shutdown_timers = []
+        if self.log.isEnabledFor(logging.DEBUG):
+            self._shutdown_timers.extend(
+                loop.call_at(deadline - minutes * 60, self._log_remaining_time, minutes)
+                for minutes in range(5, runtime_minutes, 5)
+                if deadline - minutes * 60 > now
+            )
+        self._shutdown_timers.append(loop.call_at(deadline, self._shutdown_on_timeout))
+
+    def _log_remaining_time(self, remaining_minutes: int) -> None:
+        """Log the remaining runtime for the container."""
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
+                "Container for %s has %d minutes remaining at %s",
+                self.user.name,
+                remaining_minutes,
+                time.strftime("%Y-%m-%d %H:%M:%S"),
+            )
+
+    def _shutdown_on_timeout(self) -> None:
+        """Stop the container once its requested runtime has elapsed."""
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
+                "Stopping container for user %s as requested time has elapsed at %s",
+                self.user.name,
+                time.strftime("%Y-%m-%d %H:%M:%S"),
+            )
+        asyncio.ensure_future(self.stop())
+
     async def _monitor_pod_failure(self, ref_key: str) -> None:
         """Raise immediately if the pod enters Failed phase.
 
@@ -953,38 +1216,18 @@ async def stop(self, now=False):
             self.usage_session_id = None
 
             try:
-                from core.quota import get_quota_manager
-
-                quota_manager = get_quota_manager()
-                duration, quota_used = quota_manager.end_usage_session(session_id, self.quota_rates)
-                print(f"[QUOTA] Session ended for {username}. Duration: {duration} min, Quota used: {quota_used}")
+                quota_manager = self._get_quota_manager()
+                duration, quota_used = await asyncio.to_thread(
+                    quota_manager.end_usage_session, session_id, self.quota_rates
+                )
+                self.log.info(
+                    "[QUOTA] Session ended for %s. Duration: %s min, Quota used: %s", username, duration, quota_used
+                )
             except Exception as e:
-                print(f"[QUOTA] Error ending session for {username}: {e}")
+                self.log.error("[QUOTA] Error ending session for %s: %s", username, e)
 
-        if hasattr(self, "check_timer") and self.check_timer:
-            with contextlib.suppress(Exception):
-                self.check_timer.cancel()
+        for timer in getattr(self, "_shutdown_timers", ()):
+            timer.cancel()
+        self._shutdown_timers = []
 
         return await super().stop(now=now)
-
-    def check_timeout(self) -> None:
-        """Periodic check for container timeout."""
-        if self.shutdown_time is None:
-            return
-
-        current_time = time.time()
-
-        if current_time >= self.shutdown_time:
-            self.log.debug(
-                f"Stopping container for user {self.user.name} as requested time has elapsed at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(time.time()))}"
-            )
-            asyncio.ensure_future(self.stop())
-        else:
-            loop = asyncio.get_event_loop()
-            self.check_timer = loop.call_later(60, self.check_timeout)
-
-            remaining_minutes = int((self.shutdown_time - current_time) / 60)
-            if remaining_minutes % 5 == 0:
-                self.log.debug(
-                    f"Container for {self.user.name} has {remaining_minutes} minutes remaining at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(time.time()))}"
-                )
@@ -28,7 +28,7 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Mapping
+import sys
 from functools import lru_cache
 from typing import Any, TypeVar
 
@@ -36,6 +36,30 @@
 
 T = TypeVar("T")
 
+# Use the libyaml C parser when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# path -> ((st_mtime_ns, st_size, st_ino), content) for mounted ConfigMap/Secret files
+_file_cache: dict[str, tuple[tuple[int, int, int], str]] = {}
+
+
+def _read_file_cached(path: str) -> str:
+    """Read a mounted file, re-reading it only when its stat signature changes.
+
+    Kubernetes updates ConfigMap and Secret volumes by swapping the file
+    underneath, so a rotated value is picked up without restarting the hub.
+    Raises FileNotFoundError if the file does not exist.
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _file_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with open(path) as f:
+        content = f.read()
+    _file_cache[path] = (key, content)
+    return content
+
 
 # memorize so we only load config once
 @lru_cache
@@ -47,38 +71,58 @@ def _load_config() -> dict[str, Any]:
     cfg: dict[str, Any] = {}
     for source in ("secret/values.yaml", "existing-secret/values.yaml"):
         path = f"/usr/local/etc/jupyterhub/{source}"
-        if os.path.exists(path):
-            print(f"Loading {path}")
+        try:
             with open(path) as f:
-                values = yaml.safe_load(f)
-            cfg = _merge_dictionaries(cfg, values)
-        else:
+                print(f"Loading {path}")
+                values = yaml.load(f, Loader=_YamlLoader)
+        except FileNotFoundError:
             print(f"No config at {path}")
+            continue
+        cfg = _merge_dictionaries(cfg, values)
+    _intern_keys(cfg)
     return cfg
 
 
-@lru_cache
+def _intern_keys(tree: Any) -> None:
+    """Intern all string dict keys in a parsed YAML tree, in place.
+
+    Helm values repeat the same keys (cpu, memory, image, ...) across many
+    sub-trees; interning lets them share a single string object.
+    """
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            items = list(node.items())
+            node.clear()
+            for key, value in items:
+                node[sys.intern(key) if isinstance(key, str) else key] = value
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
+
+
 def _get_config_value(key: str) -> str:
     """Load value from the k8s ConfigMap given a key."""
 
     path = f"/usr/local/etc/jupyterhub/config/{key}"
-    if os.path.exists(path):
-        with open(path) as f:
-            return f.read()
-    else:
-        raise Exception(f"{path} not found!")
+    try:
+        return _read_file_cached(path)
+    except FileNotFoundError:
+        raise Exception(f"{path} not found!") from None
 
 
-@lru_cache
 def get_secret_value(key: str, default: str | None = "never-explicitly-set") -> str | None:
     """Load value from the user managed k8s Secret or the default k8s Secret
     given a key."""
 
     for source in ("existing-secret", "secret"):
         path = f"/usr/local/etc/jupyterhub/{source}/{key}"
-        if os.path.exists(path):
-            with open(path) as f:
-                return f.read()
+        try:
+            return _read_file_cached(path)
+        except FileNotFoundError:
+            continue
     if default != "never-explicitly-set":
         return default
     raise Exception(f"{key} not found in either k8s Secret!")
@@ -103,19 +147,47 @@ def _merge_dictionaries(a: dict[str, Any], b: dict[str, Any]) -> dict[str, Any]:
     """Merge two dictionaries recursively.
 
     Simplified From https://stackoverflow.com/a/7205107
+
+    Walks the nested levels with an explicit stack instead of recursing.
+    Only dicts that exist on both sides are copied; neither input is mutated.
     """
-    merged = a.copy()
-    for key in b:
-        if key in a:
-            if isinstance(a[key], Mapping) and isinstance(b[key], Mapping):
-                merged[key] = _merge_dictionaries(a[key], b[key])
+    merged = dict(a)
+    stack = [(merged, b)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            existing = dst.get(key)
+            if isinstance(existing, dict) and isinstance(value, dict):
+                nested = dict(existing)
+                dst[key] = nested
+                stack.append((nested, value))
             else:
-                merged[key] = b[key]
-        else:
-            merged[key] = b[key]
+                dst[key] = value
     return merged
 
 
+@lru_cache
+def _flat_config() -> dict[str, Any]:
+    """Index every value of the loaded config by its dotted path.
+
+    Intermediate dicts are indexed too, so get_config("a.b") can return a
+    subtree. Keys that are not strings or that contain a dot can't be
+    addressed by a dotted path and are not indexed.
+    """
+    flat: dict[str, Any] = {}
+    stack: list[tuple[str, dict[str, Any]]] = [("", _load_config())]
+    while stack:
+        prefix, node = stack.pop()
+        for level, value in node.items():
+            if not isinstance(level, str) or "." in level:
+                continue
+            path = prefix + level
+            flat[path] = value
+            if isinstance(value, dict):
+                stack.append((path + ".", value))
+    return flat
+
+
 def get_config(key: str, default: T | None = None) -> T | Any:
     """
     Find a config item of a given name & return it
@@ -124,18 +196,7 @@ def get_config(key: str, default: T | None = None) -> T | Any:
 
     get_config("a.b.c") returns config['a']['b']['c']
     """
-    value: Any = _load_config()
-    # resolve path in yaml
-    for level in key.split("."):
-        if not isinstance(value, dict):
-            # a parent is a scalar or null,
-            # can't resolve full path
-            return default
-        if level not in value:
-            return default
-        else:
-            value = value[level]
-    return value
+    return _flat_config().get(key, default)
 
 
 def get_config_list(key: str, default: list[Any] | None = None) -> list[Any]: